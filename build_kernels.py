@@ -0,0 +1,41 @@
+"""Ahead-of-time compile the Turing machine stepping kernel.
+
+Running this script builds a ``tm_kernel`` shared object next to the
+main module via numba.pycc, so short-lived runs (e.g. the CLI demo) pay
+no JIT warm-up cost: the main module imports ``tm_kernel.run_tm`` when
+present and only falls back to the JIT or pure-Python kernel without
+it. numba.pycc was removed from recent Numba releases; if it is
+unavailable this script says so and exits without building anything.
+"""
+
+import importlib.util
+from pathlib import Path
+
+
+def main():
+    try:
+        from numba.pycc import CC
+    except ImportError as exc:
+        raise SystemExit(f"numba.pycc is unavailable ({exc}); nothing built")
+
+    # The main module's filename is not importable directly, so load it
+    # by path to reach the kernel source
+    module_path = Path(__file__).with_name("scheduling-turing-machine.py")
+    spec = importlib.util.spec_from_file_location(
+        "scheduling_turing_machine", module_path
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    # Unwrap the njit dispatcher if the import already wrapped the kernel
+    run_tm = getattr(module._run_tm, "py_func", module._run_tm)
+
+    cc = CC("tm_kernel")
+    cc.output_dir = str(Path(__file__).parent)
+    cc.export("run_tm", "UniTuple(i8, 2)(u1[:], u1[:], u4[:], i8[:])")(run_tm)
+    cc.compile()
+    print(f"Built tm_kernel in {cc.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,30 @@
 from typing import List, Dict, Tuple, Union, Optional
-from dataclasses import dataclass
-from enum import Enum
+from array import array
+from collections import namedtuple
+from collections.abc import Mapping
+import heapq
 import logging
+import re
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; the kernel below also runs as plain Python
+    njit = None
+
+# Prefer the kernel AOT-compiled by build_kernels.py when it has been
+# built: no JIT warm-up cost on short-lived runs
+_aot_run_tm = None
+if np is not None:
+    try:
+        from tm_kernel import run_tm as _aot_run_tm
+    except ImportError:
+        pass
 
 # Set up logging with more detailed format
 logging.basicConfig(
@@ -9,34 +32,41 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Tape symbols as byte values (the tape alphabet is ASCII)
+HASH = ord("#")
+BLANK = ord("B")
 
-class Direction(Enum):
-    """Direction for tape head movement"""
-
-    LEFT = "L"
-    RIGHT = "R"
-
-
-@dataclass
-class Transition:
-    """Represents a single transition in the Turing machine"""
-
-    next_state: str
-    write_symbol: str
-    direction: Direction
+# Integer ids for the machine states, used to index the flat transition
+# tables. A single left-to-right scan recognizes this grammar, so the
+# machine needs only a scanning state and a final one.
+SCAN_ID, DONE_ID = range(2)
+STATE_NAMES = ["SCAN", "DONE"]
+NUM_STATES = len(STATE_NAMES)
+FINAL_ID = DONE_ID
 
+# Dense codes for the tape alphabet: digits map to 0-9, then '#' and
+# 'B'; every other byte maps to code 13, which has no table entries.
+# 16 codes per state keep the whole transition table in one cache line.
+NUM_SYMBOL_CODES = 16
+SYM2CODE = bytearray([13]) * 256
+for _code, _sym in enumerate(b"0123456789#B"):
+    SYM2CODE[_sym] = _code
 
-class TapeCell:
-    """Represents a single cell on the Turing machine tape"""
+# Each transition packs into one uint32:
+#   bits 0-3   next state id (0xF marks an invalid transition)
+#   bits 4-11  byte to write
+#   bits 12-13 head move delta + 1
+#   bit 14     flush the accumulated number (separator entries)
+INVALID_STATE = 0xF
+FLUSH_BIT = 1 << 14
 
-    def __init__(self, value: str):
-        self.value = value
 
-    def is_blank(self) -> bool:
-        return self.value == "B"
+# Tape head movement deltas
+LEFT = -1
+RIGHT = 1
 
-    def __str__(self) -> str:
-        return str(self.value)
+# A single transition rule: next state name, byte to write, head move delta
+Transition = namedtuple("Transition", "next_state write_symbol_byte delta")
 
 
 class TuringMachineState:
@@ -45,19 +75,175 @@ class TuringMachineState:
     def __init__(self, name: str, is_final: bool = False):
         self.name = name
         self.is_final = is_final
-        self.transitions: Dict[str, Transition] = {}
+        self.transitions: Dict[int, Transition] = {}
 
     def add_transition(
-        self, read_symbol: str, next_state: str, write_symbol: str, direction: Direction
+        self, read_symbol: str, next_state: str, write_symbol: str, delta: int
     ):
         """Add a transition rule for this state"""
-        self.transitions[read_symbol] = Transition(next_state, write_symbol, direction)
+        self.transitions[ord(read_symbol)] = Transition(
+            next_state, ord(write_symbol), delta
+        )
 
-    def get_transition(self, symbol: str) -> Optional[Transition]:
-        """Get transition for a given symbol"""
+    def get_transition(self, symbol: int) -> Optional[Transition]:
+        """Get transition for a given symbol byte"""
         return self.transitions.get(symbol)
 
 
+def _run_tm(tape, sym2code, trans_tbl, out) -> Tuple[int, int]:
+    """Run the Turing machine over the tape and collect the order sizes.
+
+    The loop is pure integer arithmetic over flat arrays so it can be
+    JIT-compiled by Numba when available; the same code runs as plain
+    Python otherwise. Each transition is one packed uint32 unpacked
+    with shifts and masks. Parsed order sizes are written into ``out``
+    and the number of orders is returned together with the final head
+    position. On an invalid transition the count is -1 and the head
+    position points at the offending symbol.
+    """
+    # Hoist module constants into locals: LOAD_FAST instead of
+    # LOAD_GLOBAL per step in the interpreter (Numba folds them anyway)
+    num_codes = NUM_SYMBOL_CODES
+    invalid = INVALID_STATE
+    flush_bit = FLUSH_BIT
+    final_id = FINAL_ID
+
+    pos = 0
+    state = SCAN_ID
+    count = 0
+    current_number = 0
+    has_digits = False
+
+    # DONE has the highest id, so "not halted" is a single compare;
+    # every transition ends in one unconditional add to pos
+    while state < final_id:
+        sym = tape[pos]
+        entry = trans_tbl[state * num_codes + sym2code[sym]]
+        next_state = entry & 0xF
+        if next_state == invalid:
+            return -1, pos
+
+        if 48 <= sym <= 57:
+            current_number = current_number * 10 + (sym - 48)
+            has_digits = True
+        elif (entry & flush_bit) != 0 and has_digits:
+            out[count] = current_number
+            count += 1
+            current_number = 0
+            has_digits = False
+
+        tape[pos] = (entry >> 4) & 0xFF
+        pos += ((entry >> 12) & 3) - 1
+        state = next_state
+
+    return count, pos
+
+
+if njit is not None and np is not None:
+    _run_tm = njit(cache=True)(_run_tm)
+
+
+def _compile_specialized_run(states: Dict[str, "TuringMachineState"]):
+    """Generate an unrolled stepping function for a fixed program.
+
+    The TM program never changes once built, so instead of interpreting
+    the packed table we emit Python source with every transition
+    unrolled into constant comparisons, then exec it. CPython then runs
+    straight-line integer code with no table loads; writes that would
+    re-write the symbol already on the tape are dropped entirely. The
+    generated function has the same signature as _run_tm and simply
+    ignores the table arguments.
+    """
+    src = []
+    emit = src.append
+    emit("def _run_tm_specialized(tape, sym2code, trans_tbl, out):")
+    emit("    pos = 0")
+    emit(f"    state = {SCAN_ID}")
+    emit("    count = 0")
+    emit("    current_number = 0")
+    emit("    has_digits = False")
+    emit(f"    while state < {FINAL_ID}:")
+    emit("        sym = tape[pos]")
+
+    def emit_actions(pad, transition, digit_range=False, sym=None):
+        """Emit the body of one unrolled transition branch"""
+        if digit_range or 48 <= sym <= 57:
+            increment = "(sym - 48)" if digit_range else str(sym - 48)
+            emit(f"{pad}current_number = current_number * 10 + {increment}")
+            emit(f"{pad}has_digits = True")
+        elif sym in (HASH, BLANK):
+            emit(f"{pad}if has_digits:")
+            emit(f"{pad}    out[count] = current_number")
+            emit(f"{pad}    count += 1")
+            emit(f"{pad}    current_number = 0")
+            emit(f"{pad}    has_digits = False")
+        identity_write = (
+            digit_range and transition.write_symbol_byte is None
+        ) or transition.write_symbol_byte == sym
+        if not identity_write:
+            emit(f"{pad}tape[pos] = {transition.write_symbol_byte}")
+        if transition.delta > 0:
+            emit(f"{pad}pos += 1")
+        elif transition.delta < 0:
+            emit(f"{pad}pos -= 1")
+        emit(f"{pad}state = {STATE_NAMES.index(transition.next_state)}")
+
+    state_kw = "if"
+    for state_id, state_name in enumerate(STATE_NAMES):
+        transitions = states[state_name].transitions
+        if state_id == FINAL_ID or not transitions:
+            continue
+        emit(f"        {state_kw} state == {state_id}:")
+        state_kw = "elif"
+
+        # Collapse the ten digit rules into one range test when they
+        # all agree on next state, move, and write behaviour (identity
+        # writes or one shared constant)
+        digit_ts = [transitions.get(d) for d in range(48, 58)]
+        digit_writes = {t.write_symbol_byte for t in digit_ts if t is not None}
+        uniform_digits = (
+            all(t is not None for t in digit_ts)
+            and len({(t.next_state, t.delta) for t in digit_ts}) == 1
+            and (
+                all(
+                    t.write_symbol_byte == d
+                    for d, t in zip(range(48, 58), digit_ts)
+                )
+                or len(digit_writes) == 1
+            )
+        )
+
+        branch_kw = "if"
+        if uniform_digits:
+            emit(f"            {branch_kw} 48 <= sym <= 57:")
+            branch_kw = "elif"
+            template = digit_ts[0]
+            if all(
+                t.write_symbol_byte == d for d, t in zip(range(48, 58), digit_ts)
+            ):
+                # Identity writes: mark them skippable via a None byte
+                template = template._replace(write_symbol_byte=None)
+            emit_actions("                ", template, digit_range=True)
+
+        for symbol, transition in transitions.items():
+            if uniform_digits and 48 <= symbol <= 57:
+                continue
+            emit(f"            {branch_kw} sym == {symbol}:")
+            branch_kw = "elif"
+            emit_actions("                ", transition, sym=symbol)
+
+        emit("            else:")
+        emit("                return -1, pos")
+
+    emit("        else:")
+    emit("            return -1, pos")
+    emit("    return count, pos")
+
+    namespace = {}
+    exec(compile("\n".join(src), "<tm-specialized>", "exec"), namespace)
+    return namespace["_run_tm_specialized"]
+
+
 class SchedulingTuringMachine:
     """Implementation of a Turing machine for scheduling problems"""
 
@@ -66,162 +252,261 @@ class SchedulingTuringMachine:
         self.production_rate = production_rate
 
         # Initialize machine components
-        self.tape: List[TapeCell] = []
+        self.tape = bytearray()
         self.head_position = 0
-        self.states: Dict[str, TuringMachineState] = {}
-        self.current_state: TuringMachineState = None
+        self.current_state_id = SCAN_ID
+
+        # Initialize scheduling data; times are kept as integers in
+        # 1/production_rate units (i.e. order-size units) so the inner
+        # loop does no float arithmetic, and the heap orders machines by
+        # (available_time_units, machine_id) so ties go to the lowest id
+        self._machine_time_units = array("q", [0] * num_machines)
+        self.machine_heap = [(0, i) for i in range(num_machines)]
+        heapq.heapify(self.machine_heap)
 
-        # Initialize scheduling data
-        self.machine_times = [0] * num_machines
-        self.machine_schedules = [[] for _ in range(num_machines)]
+        # Flat assignment records (machine_id, size, start_units),
+        # preallocated per run once the order count is known
+        self._assignments: List[Tuple[int, int, int]] = []
+        self._assignment_count = 0
 
         # Set up the Turing machine states and transitions
         self._setup_states()
 
-        # Buffer for building numbers
-        self.current_number: List[str] = []
+    # Memoized (states, sym2code, trans_tbl, kernel) shared by all
+    # instances; the TM program is fixed so it is built only once
+    _compiled_program = None
 
-    def _setup_states(self):
-        """Set up all states and transitions for the Turing machine"""
-        # Create states
+    @classmethod
+    def _build_program(cls):
+        """Build and memoize the states and flat transition tables"""
+        if cls._compiled_program is not None:
+            return cls._compiled_program
+
+        # Create states: a single forward scan recognizes this grammar,
+        # so the old START/READ/MARK/NEXT oscillation collapses to one
+        # scanning state that never moves left or rewrites the tape
         state_configs = {
-            "START": False,  # Initial state
-            "READ": False,  # Reading digits
-            "MARK": False,  # Marking processed
-            "NEXT": False,  # Moving to next number
-            "FINAL": True,  # Final state
+            "SCAN": False,  # Scanning digits and separators rightwards
+            "DONE": True,  # Final state
         }
 
         # Initialize all states
+        states: Dict[str, TuringMachineState] = {}
         for state_name, is_final in state_configs.items():
-            self.states[state_name] = TuringMachineState(state_name, is_final)
+            states[state_name] = TuringMachineState(state_name, is_final)
 
         # Define all possible symbols
         digits = ["0", "1", "2", "3", "4", "5", "6", "7", "8", "9"]
 
-        # Add transitions for START state
-        self.states["START"].add_transition("B", "FINAL", "B", Direction.RIGHT)
-        self.states["START"].add_transition("#", "READ", "#", Direction.RIGHT)
-        for digit in digits:
-            self.states["START"].add_transition(digit, "READ", digit, Direction.RIGHT)
-
-        # Add transitions for READ state
-        for digit in digits:
-            self.states["READ"].add_transition(digit, "READ", digit, Direction.RIGHT)
-        self.states["READ"].add_transition("#", "MARK", "#", Direction.LEFT)
-        self.states["READ"].add_transition("B", "MARK", "B", Direction.LEFT)
-
-        # Add transitions for MARK state
-        for digit in digits:
-            self.states["MARK"].add_transition(digit, "MARK", "*", Direction.LEFT)
-        self.states["MARK"].add_transition("#", "NEXT", "#", Direction.RIGHT)
-
-        # Add transitions for NEXT state
+        # Add transitions for SCAN state: digits accumulate into the
+        # current number, '#' flushes it, the blank flushes and halts
         for digit in digits:
-            self.states["NEXT"].add_transition(digit, "READ", digit, Direction.RIGHT)
-        self.states["NEXT"].add_transition("#", "READ", "#", Direction.RIGHT)
-        self.states["NEXT"].add_transition("B", "FINAL", "B", Direction.RIGHT)
-        self.states["NEXT"].add_transition("*", "NEXT", "*", Direction.RIGHT)
-
-        # Set initial state
-        self.current_state = self.states["START"]
-
-    def _find_best_machine(self, order_size: int) -> int:
-        """Find the machine with earliest availability"""
-        min_time = float("inf")
-        best_machine = 0
-
-        for i in range(self.num_machines):
-            if self.machine_times[i] < min_time:
-                min_time = self.machine_times[i]
-                best_machine = i
-
-        # Calculate processing time and update machine schedule
-        processing_time = order_size / self.production_rate
-        self.machine_times[best_machine] += processing_time
-        self.machine_schedules[best_machine].append((order_size, min_time))
+            states["SCAN"].add_transition(digit, "SCAN", digit, RIGHT)
+        states["SCAN"].add_transition("#", "SCAN", "#", RIGHT)
+        states["SCAN"].add_transition("B", "DONE", "B", RIGHT)
+
+        # Packed transition table indexed by state_id * 16 + symbol_code;
+        # entries left at INVALID_STATE mark invalid transitions
+        trans_tbl = array("I", [INVALID_STATE] * (NUM_STATES * NUM_SYMBOL_CODES))
+
+        # Flatten the per-state transition dicts into the packed table
+        # so the main loop needs a single index computation per step
+        for state_id, state_name in enumerate(STATE_NAMES):
+            for symbol, transition in states[state_name].transitions.items():
+                entry = (
+                    STATE_NAMES.index(transition.next_state)
+                    | (transition.write_symbol_byte << 4)
+                    | ((transition.delta + 1) << 12)
+                )
+                if symbol in (HASH, BLANK):
+                    entry |= FLUSH_BIT
+                trans_tbl[state_id * NUM_SYMBOL_CODES + SYM2CODE[symbol]] = entry
+
+        # Numba needs typed NumPy views of the tables; they share the
+        # underlying buffers with the originals
+        sym2code = SYM2CODE
+        if np is not None:
+            sym2code = np.frombuffer(SYM2CODE, dtype=np.uint8)
+            trans_tbl = np.frombuffer(trans_tbl, dtype=np.uint32)
+
+        # Pick the stepping kernel: the AOT-compiled table interpreter
+        # when built, else the Numba JIT one, else a function
+        # exec-generated from the program with every transition
+        # unrolled to constant compares
+        if _aot_run_tm is not None:
+            kernel = _aot_run_tm
+        elif njit is not None and np is not None:
+            kernel = _run_tm
+        else:
+            kernel = _compile_specialized_run(states)
 
-        logger.debug(f"Assigned order {order_size} to machine {best_machine}")
-        return best_machine
+        cls._compiled_program = (states, sym2code, trans_tbl, kernel)
+        return cls._compiled_program
 
-    def _prepare_tape(self, orders: List[int]) -> List[TapeCell]:
+    def _setup_states(self):
+        """Bind the memoized states, tables and kernel to this instance"""
+        self.states, self.sym2code, self.trans_tbl, self._kernel = (
+            self._build_program()
+        )
+        self.current_state_id = SCAN_ID
+
+    def _assign_orders(self, orders):
+        """Assign each order to the machine with earliest availability.
+
+        Hot attributes are bound to locals once before the loop so each
+        assignment costs LOAD_FASTs instead of repeated attribute and
+        method lookups on self.
+        """
+        heap = self.machine_heap
+        time_units = self._machine_time_units
+        assignments = self._assignments
+        count = self._assignment_count
+        heappop = heapq.heappop
+        heappush = heapq.heappush
+        # Guard so the f-string is not formatted at the default INFO level
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+        for order_size in orders:
+            start_units, best_machine = heappop(heap)
+
+            # Processing time in units is just the order size
+            heappush(heap, (start_units + order_size, best_machine))
+            time_units[best_machine] += order_size
+            assignments[count] = (best_machine, order_size, start_units)
+            count += 1
+
+            if debug_enabled:
+                logger.debug(f"Assigned order {order_size} to machine {best_machine}")
+
+        self._assignment_count = count
+
+    def _reset_assignments(self, num_orders: int):
+        """Preallocate the assignment records for a run of known size"""
+        self._assignments = [(0, 0, 0)] * num_orders
+        self._assignment_count = 0
+
+    def _prepare_tape(self, orders: List[int]) -> bytearray:
         """Prepare the tape with input orders"""
-        tape = []
-
-        for order in orders:
-            # Add separator before each number
-            tape.append(TapeCell("#"))
-            # Convert number to digits and add to tape
-            for digit in str(order):
-                tape.append(TapeCell(digit))
-
-        # Add blank symbol at the end
-        tape.append(TapeCell("B"))
-
-        return tape
-
-    def process_orders(self, orders: List[int]) -> Dict:
+        # One join builds '#' + digits per order, then the blank; a
+        # single allocation instead of per-digit appends
+        return (
+            bytearray(b"#".join([b""] + [str(order).encode() for order in orders]))
+            + b"B"
+        )
+
+    def process_orders(self, orders: List[int]) -> "ScheduleView":
         """Process a list of orders through the Turing machine"""
         # Initialize/reset machine state
         self.tape = self._prepare_tape(orders)
         self.head_position = 0
-        self.current_state = self.states["START"]
-        self.current_number = []
+        self.current_state_id = SCAN_ID
 
         logger.info("Starting order processing...")
 
-        # Main processing loop
-        while not self.current_state.is_final:
-            current_symbol = self.tape[self.head_position].value
-
-            # Get next transition
-            transition = self.current_state.get_transition(current_symbol)
-            if not transition:
-                raise Exception(
-                    f"No valid transition for state '{self.current_state.name}' "
-                    f"and symbol '{current_symbol}'"
-                )
-
-            # Process current symbol based on state
-            if self.current_state.name == "READ":
-                if current_symbol.isdigit():
-                    self.current_number.append(current_symbol)
-
-            elif self.current_state.name == "MARK" and self.current_number:
-                # Process completed number
-                order_size = int("".join(self.current_number))
-                self._find_best_machine(order_size)
-                self.current_number = []
-
-            # Apply transition
-            self.tape[self.head_position].value = transition.write_symbol
-            self.current_state = self.states[transition.next_state]
-            self.head_position += 1 if transition.direction == Direction.RIGHT else -1
-
-            logger.debug(
-                f"State: {self.current_state.name}, "
-                f"Symbol: {current_symbol}, "
-                f"Position: {self.head_position}"
+        # Run the Turing machine kernel over the tape
+        if np is not None:
+            tape_view = np.frombuffer(self.tape, dtype=np.uint8)
+            parsed_orders = np.empty(len(orders), dtype=np.int64)
+        else:
+            tape_view = self.tape
+            parsed_orders = [0] * len(orders)
+
+        count, pos = self._kernel(
+            tape_view, self.sym2code, self.trans_tbl, parsed_orders
+        )
+        self.head_position = pos
+        if count < 0:
+            raise Exception(
+                f"No valid transition for symbol '{chr(self.tape[pos])}' "
+                f"at position {pos}"
             )
+        self.current_state_id = FINAL_ID
+
+        # Schedule the parsed orders
+        self._reset_assignments(count)
+        self._assign_orders(int(parsed_orders[i]) for i in range(count))
 
         logger.info("Order processing complete.")
         return self._generate_schedule()
 
-    def _generate_schedule(self) -> Dict:
-        """Generate the final schedule report"""
-        schedule = {}
-        for i, machine_schedule in enumerate(self.machine_schedules):
-            schedule[f"Machine_{i+1}"] = {
-                "orders": [
-                    {"size": size, "start_time": start}
-                    for size, start in machine_schedule
-                ],
-                "total_time": self.machine_times[i],
-            }
-        return schedule
-
-
-def print_schedule(schedule: Dict):
+    def schedule_orders(
+        self, orders: Union[List[int], bytes, bytearray], simulate: bool = False
+    ) -> "ScheduleView":
+        """Schedule orders directly, without the Turing machine.
+
+        Accepts either a list of order sizes or a raw tape in the
+        #num#num...B format. Integer orders go straight to the
+        scheduler with no serialization round-trip; a raw tape is
+        parsed with one regex scan, which is equivalent to the TM's
+        parse step since the tape language is regular. Either way the
+        schedule is identical to process_orders. Pass simulate=True to
+        run the full Turing machine instead, for demonstration
+        purposes.
+        """
+        if isinstance(orders, (bytes, bytearray)):
+            orders = [int(number) for number in re.findall(rb"\d+", orders)]
+
+        if simulate:
+            return self.process_orders(orders)
+
+        logger.info("Scheduling orders (no simulation)...")
+        self._reset_assignments(len(orders))
+        self._assign_orders(orders)
+        return self._generate_schedule()
+
+    def _generate_schedule(self) -> "ScheduleView":
+        """Generate the final schedule report as a lazy view"""
+        # Snapshot the run's records so later runs on this instance do
+        # not mutate an already returned view
+        return ScheduleView(
+            self._assignments[: self._assignment_count],
+            array("q", self._machine_time_units),
+            self.production_rate,
+        )
+
+
+class ScheduleView(Mapping):
+    """Lazy, read-only mapping view of a production schedule.
+
+    Keyed by "Machine_1" ... "Machine_<n>" like the dict that
+    _generate_schedule used to return, but each machine's order detail
+    is computed on demand from the flat assignment records, so callers
+    that only look at a few machines (or none) pay nothing for the
+    rest.
+    """
+
+    def __init__(self, assignments, machine_time_units, production_rate):
+        self._assignments = assignments
+        self._machine_time_units = machine_time_units
+        self._production_rate = production_rate
+
+    def __len__(self) -> int:
+        return len(self._machine_time_units)
+
+    def __iter__(self):
+        return (f"Machine_{i+1}" for i in range(len(self)))
+
+    def __getitem__(self, key: str) -> Dict:
+        try:
+            machine_id = int(str(key).replace("Machine_", "")) - 1
+        except ValueError:
+            raise KeyError(key)
+        if not 0 <= machine_id < len(self._machine_time_units):
+            raise KeyError(key)
+
+        rate = self._production_rate
+        # Scanning in assignment order keeps the orders chronological
+        return {
+            "orders": [
+                {"size": size, "start_time": start_units / rate}
+                for assigned_to, size, start_units in self._assignments
+                if assigned_to == machine_id
+            ],
+            "total_time": self._machine_time_units[machine_id] / rate,
+        }
+
+
+def print_schedule(schedule: Mapping):
     """Print the schedule in a formatted way"""
     print("\nProduction Schedule:")
     print("=" * 50)